@@ -2,8 +2,15 @@
 
 import logging
 import re
+import os
+import sys
+import json
+import uuid
 import threading
 import functools
+import collections
+import queue
+import time
 
 from errbot.backends.base import (
         Message, Presence, ONLINE, AWAY, Room, RoomOccupant, Person, 
@@ -16,17 +23,291 @@ from errbot.core import ErrBot
 log = logging.getLogger('errbot.backends.letschat')
 
 
-try:
-    from socketIO_client import SocketIO, BaseNamespace
-    from socketIO_client.namespaces import find_callback
-    from socketIO_client.parsers import format_socketIO_packet_data
-except ImportError:
-    log.exception("Could not start the lets-chat back-end")
-    log.fatal(
-            "You need to install the socketIO_client support in order to use the lets-chat."
-            "You can do `pip install errbot socketIO_client` to install it."
-    )
-    sys.exit(1)
+_socketio = None
+
+
+def _import_socketio():
+    """
+    Import socketIO_client on first use
+
+    Loading the back-end (for tests, config checks or plugin development)
+    does not need the transport; only connecting to lets-chat does.
+
+    :raises ImportError:
+        socketIO_client is not installed; the message says how to fix it.
+    """
+    global _socketio
+    if _socketio is None:
+        try:
+            import socketIO_client
+        except ImportError as e:
+            raise ImportError(
+                    "You need to install the socketIO_client support in order to use the lets-chat. "
+                    "You can do `pip install errbot socketIO_client` to install it."
+            ) from e
+        _socketio = socketIO_client
+    return _socketio
+
+
+# Used when the config has no errbot MESSAGE_SIZE_LIMIT.
+MESSAGE_SIZE_LIMIT = 4096
+# Seconds to wait between the chunks of one long message.
+MESSAGE_INTERVAL = 0.5
+
+CODE_FENCE = '```'
+
+
+def _close_chunk(lines, fence):
+    chunk = '\n'.join(lines)
+    if fence is not None:
+        chunk += '\n' + CODE_FENCE
+    return chunk
+
+
+def split_message(text, limit=MESSAGE_SIZE_LIMIT):
+    """
+    Split a message body into chunks of at most ``limit`` characters.
+
+    Chunks are cut on line boundaries where possible. A line too long for
+    a chunk of its own is cut hard, and only at the end of a chunk, so its
+    pieces are never joined with a newline. A code fence left open at the
+    end of a chunk is closed there and reopened at the start of the next
+    one, so each chunk renders on its own.
+    """
+    if len(text) <= limit:
+        yield text
+        return
+
+    closing = len(CODE_FENCE) + 1
+    lines = []
+    size = 0
+    fence = None
+    for line in text.split('\n'):
+        after = fence
+        if line.strip().startswith(CODE_FENCE) and len(line) + closing <= limit:
+            after = None if fence else line
+
+        # room in an otherwise empty chunk, after the reopened fence and its close.
+        fresh = max(1, limit - (len(fence) + 1 + closing if fence is not None else 0))
+        while len(line) > fresh:
+            room = limit - size - (1 if lines else 0) - (closing if fence is not None else 0)
+            if room < 1 and len(lines) > (1 if fence else 0):
+                yield _close_chunk(lines, fence)
+                lines = [fence] if fence is not None else []
+                size = len(fence) if fence is not None else 0
+                continue
+            room = max(1, room)
+            lines.append(line[:room])
+            line = line[room:]
+            yield _close_chunk(lines, fence)
+            lines = [fence] if fence is not None else []
+            size = len(fence) if fence is not None else 0
+
+        needed = size + len(line) + (1 if lines else 0)
+        if after is not None:
+            needed += closing
+        if len(lines) > (1 if fence else 0) and needed > limit:
+            yield _close_chunk(lines, fence)
+            lines = [fence] if fence is not None else []
+            size = len(fence) if fence is not None else 0
+        size += len(line) + (1 if lines else 0)
+        lines.append(line)
+        fence = after
+
+    if lines:
+        yield '\n'.join(lines)
+
+
+# Acknowledged entries tolerated in the journal file before it is rewritten.
+JOURNAL_COMPACT_THRESHOLD = 256
+
+
+class OutboundJournal():
+    """
+    Durable append-only log of outbound messages
+
+    Every message is written to the journal before it is sent and stays
+    there until lets-chat acknowledges it, so messages survive a dropped
+    connection or a restart. Writes are group committed: a single writer
+    thread flushes and fsyncs everything queued since its last commit, so
+    concurrent senders share one fsync.
+
+    Delivery is at-least-once. lets-chat does not return a client-side id
+    with its messages, so a message that reached the server but whose ack
+    was lost with the connection is sent again after reconnecting. Entry
+    ids only deduplicate appends: appending an id that is still pending
+    writes nothing, but still waits until that entry is on disk.
+
+    If the writer thread fails (a full disk, a read-only BOT_DATA_DIR, ...)
+    the error is kept and raised by every later :meth:`append`.
+
+    Init:
+        :Args:
+            path (str): journal file location.
+            compact_threshold (int): acknowledged entries before compaction.
+    """
+
+    def __init__(self, path, compact_threshold=JOURNAL_COMPACT_THRESHOLD):
+        self._path = path
+        self._compact_threshold = compact_threshold
+        self._cond = threading.Condition()
+        self._pending = collections.OrderedDict()
+        # commit sequence of each pending entry's put record.
+        self._sequences = {}
+        self._queue = []
+        self._queued = 0
+        self._committed = 0
+        self._acked = 0
+        self._closed = False
+        self._error = None
+
+        self._load()
+        self._file = None
+        self._compact(list(self._pending.items()))
+
+        self._writer = threading.Thread(target=self._commit_loop, name='letschat-journal', daemon=True)
+        self._writer.start()
+
+    def _load(self):
+        try:
+            with open(self._path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        if record['op'] == 'put':
+                            self._pending[record['id']] = record['message']
+                        elif record['op'] == 'ack':
+                            self._pending.pop(record['id'], None)
+                    except (ValueError, TypeError, KeyError):
+                        # torn write at the tail, nothing after it was committed.
+                        log.warning('Ignoring malformed journal record in {}'.format(self._path))
+                        break
+        except FileNotFoundError:
+            pass
+
+        if self._pending:
+            log.info('{} unsent message(s) in {}'.format(len(self._pending), self._path))
+
+    def _compact(self, entries):
+        """
+        Replace the journal file with one holding only the given entries
+
+        Only the writer thread (or __init__, before it starts) touches the
+        file, and entries must include every put committed so far.
+        """
+        tmp_path = '{}.tmp'.format(self._path)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for entry_id, message in entries:
+                f.write(json.dumps({'op': 'put', 'id': entry_id, 'message': message}) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        if self._file is not None:
+            self._file.close()
+        os.replace(tmp_path, self._path)
+        self._file = open(self._path, 'a', encoding='utf-8')
+
+    def _commit_loop(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                batch, self._queue = self._queue, []
+                sequence = self._queued
+
+            try:
+                for record in batch:
+                    self._file.write(json.dumps(record) + '\n')
+                self._file.flush()
+                os.fsync(self._file.fileno())
+
+                entries = None
+                with self._cond:
+                    self._committed = sequence
+                    self._cond.notify_all()
+                    if not self._queue and self._acked >= self._compact_threshold:
+                        # records queued from now on go to the new file.
+                        entries = list(self._pending.items())
+                        self._acked = 0
+
+                if entries is not None:
+                    self._compact(entries)
+            except Exception as e:
+                log.exception('Could not write the outbound journal {}'.format(self._path))
+                with self._cond:
+                    self._error = e
+                    self._queue = []
+                    self._cond.notify_all()
+                return
+
+    def append(self, message, entry_id=None):
+        """
+        Add a message to the journal and wait until it is on disk
+
+        :param message:
+            The messages:create payload.
+        :param entry_id:
+            Client-side id of the entry, generated when omitted.
+        :returns:
+            The id of the entry.
+        :raises:
+            The error that stopped the writer thread, if any.
+        """
+        if entry_id is None:
+            entry_id = uuid.uuid4().hex
+
+        with self._cond:
+            if self._error is not None:
+                raise self._error
+            if self._closed:
+                raise RuntimeError('Journal {} is closed'.format(self._path))
+            if entry_id in self._pending:
+                # already appended, possibly not committed yet.
+                sequence = self._sequences.get(entry_id, 0)
+            else:
+                self._pending[entry_id] = message
+                self._queue.append({'op': 'put', 'id': entry_id, 'message': message})
+                self._queued += 1
+                sequence = self._queued
+                self._sequences[entry_id] = sequence
+                self._cond.notify_all()
+            while self._committed < sequence and self._error is None:
+                self._cond.wait()
+            if self._committed < sequence:
+                # never reached the disk, the caller has to send it itself.
+                self._pending.pop(entry_id, None)
+                self._sequences.pop(entry_id, None)
+                raise self._error
+
+        return entry_id
+
+    def ack(self, entry_id):
+        """
+        Mark an entry as delivered
+        """
+        with self._cond:
+            self._sequences.pop(entry_id, None)
+            if self._pending.pop(entry_id, None) is None or self._error is not None:
+                return
+            self._queue.append({'op': 'ack', 'id': entry_id})
+            self._queued += 1
+            self._acked += 1
+            self._cond.notify_all()
+
+    def pending(self):
+        """
+        Return the unacknowledged entries as (id, message) pairs, oldest first
+        """
+        with self._cond:
+            return list(self._pending.items())
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._writer.join()
+        self._file.close()
 
 
 class LetschatClient():
@@ -41,11 +322,14 @@ class LetschatClient():
             hostname (str): lets-chat host.
             port (int): lets-chat using port.
             token (str): Your lets-chat Authentication token.
+            journal (OutboundJournal): optional outbound message journal.
     """
 
-    class LetschatNamespace(BaseNamespace):
+    class LetschatNamespace():
         """
         Define socket.io client behavier for lets-chat
+
+        Mixed into socketIO_client's BaseNamespace when connecting.
         """
 
         def __init__(self, io, path):
@@ -54,6 +338,8 @@ class LetschatClient():
             self._connected = False
             self._rooms = []
             self._joined_rooms = []
+            self.on_ready_handler = None
+            self.on_lost_handler = None
 
         def on_connect(self, *args):
             self._io.on('rooms:new', self.on_rooms_new_message)
@@ -73,6 +359,15 @@ class LetschatClient():
             if not self._connected:
                 log.info('Connected')
                 self._connected = True
+                if self.on_ready_handler is not None:
+                    self.on_ready_handler()
+
+        def on_disconnect(self, *args):
+            if self._connected:
+                log.info('Disconnected')
+                self._connected = False
+                if self.on_lost_handler is not None:
+                    self.on_lost_handler()
 
         def on_rooms_join_response(self, *args):
             room = args[0]
@@ -122,17 +417,46 @@ class LetschatClient():
         def connected(self):
             return self._connected
 
-    def __init__(self, hostname, port, token, protocol='http', callbacks={}):
-        self._sio = SocketIO('{}://{}'.format(protocol, hostname), port,
-                             LetschatClient.LetschatNamespace,
-                             params={'token': token})
+    def __init__(self, hostname, port, token, protocol='http', callbacks={}, journal=None):
+        self._url = '{}://{}'.format(protocol, hostname)
+        self._port = port
+        self._token = token
+        self._sio = None
+        self._journal = journal
+        self._in_flight = set()
+        # journaled messages go out directly only once the backlog is drained.
+        self._live = False
+        self._send_lock = threading.Lock()
         self.on_users_join_handler = callbacks.get('on_users_join', None)
         self.on_users_leave_handler = callbacks.get('on_users_leave', None)
         self.on_messages_new_handler = callbacks.get('on_messages_new', None)
 
-        # wait for connection sequence.
-        while not self._sio.get_namespace().connected:
-            self._sio.wait(seconds=1)
+    def connect(self):
+        """
+        Open the websocket and wait for the connection sequence to finish
+        """
+        if self._sio is not None:
+            return
+
+        socketio = _import_socketio()
+        namespace = type('LetschatNamespace',
+                         (LetschatClient.LetschatNamespace, socketio.BaseNamespace), {})
+        self._sio = socketio.SocketIO(self._url, self._port, namespace,
+                                      params={'token': self._token})
+        try:
+            self._sio.on('users:join', self.on_users_join_handler)
+            self._sio.on('users:leave', self.on_users_leave_handler)
+            self._sio.on('messages:new', self.on_messages_new_handler)
+            self.server.on_ready_handler = self._drain_journal
+            self.server.on_lost_handler = self._on_connection_lost
+
+            # wait for connection sequence.
+            while not self.server.connected:
+                self._sio.wait(seconds=1)
+        except BaseException:
+            # let the next connect() start over.
+            self._sio = None
+            raise
 
     def emit(self, event, *args, **kw):
         self._sio.emit(event, *args, **kw)
@@ -140,8 +464,91 @@ class LetschatClient():
     def wait(self, seconds=None):
         self._sio.wait(seconds)
 
-    def emit_messages_create(self, message):
-        self.emit('messages:create', message)
+    def emit_messages_create(self, message, entry_id=None):
+        """
+        Send a message, through the journal when there is one
+
+        Journaled messages are delivered at least once and in order: while
+        the connection is down or the backlog is being drained, the
+        message is only appended and the drain sends it.
+
+        :param message:
+            The messages:create payload.
+        :param entry_id:
+            Client-side journal id, see :meth:`OutboundJournal.append`.
+        """
+        if self._journal is None:
+            self.emit('messages:create', message)
+            return
+
+        try:
+            entry_id = self._journal.append(message, entry_id)
+        except Exception:
+            log.exception('Could not journal an outbound message, sending it directly')
+            self.emit('messages:create', message)
+            return
+
+        with self._send_lock:
+            live = self._live
+        if live:
+            self._emit_journaled(entry_id, message)
+
+    def _emit_journaled(self, entry_id, message):
+        """
+        Send a journal entry unless it is already on its way
+        """
+        with self._send_lock:
+            if entry_id in self._in_flight:
+                return
+            self._in_flight.add(entry_id)
+
+        def on_messages_create_response(*args):
+            self._journal.ack(entry_id)
+            with self._send_lock:
+                self._in_flight.discard(entry_id)
+
+        try:
+            self.emit('messages:create', message, on_messages_create_response)
+        except Exception:
+            with self._send_lock:
+                self._in_flight.discard(entry_id)
+            raise
+
+    def _on_connection_lost(self):
+        with self._send_lock:
+            self._live = False
+            # anything sent without an ack is resent by the next drain.
+            self._in_flight.clear()
+
+    def _drain_journal(self):
+        """
+        Resend the unacknowledged journal entries in order after (re)connecting
+
+        Live sends resume once a pass finds nothing left to send, so no new
+        message can overtake an older journaled one.
+        """
+        if self._journal is None:
+            with self._send_lock:
+                self._live = True
+            return
+
+        while True:
+            with self._send_lock:
+                pending = [(entry_id, message) for entry_id, message in self._journal.pending()
+                           if entry_id not in self._in_flight]
+                if not pending:
+                    self._live = True
+                    return
+
+            log.info('Resending {} journaled message(s)'.format(len(pending)))
+            for entry_id, message in pending:
+                if not self.connected:
+                    return
+                try:
+                    self._emit_journaled(entry_id, message)
+                except Exception:
+                    log.exception('Could not resend journaled message {}'.format(entry_id))
+                    return
 
     def emit_rooms_join(self, roomid):
         self.emit('rooms:join', roomid, self.server.on_rooms_join_response)
@@ -213,7 +620,8 @@ class LetschatClient():
     @on_users_join_handler.setter
     def on_users_join_handler(self, handler):
         self._on_users_join_handler = handler
-        self._sio.on('users:join', self.on_users_join_handler)
+        if self._sio is not None:
+            self._sio.on('users:join', self.on_users_join_handler)
         return True
 
     @property
@@ -223,7 +631,8 @@ class LetschatClient():
     @on_users_leave_handler.setter
     def on_users_leave_handler(self, handler):
         self._on_users_leave_handler = handler
-        self._sio.on('users:leave', self.on_users_leave_handler)
+        if self._sio is not None:
+            self._sio.on('users:leave', self.on_users_leave_handler)
         return True
 
     @property
@@ -233,13 +642,20 @@ class LetschatClient():
     @on_messages_new_handler.setter
     def on_messages_new_handler(self, handler):
         self._on_messages_new_handler = handler
-        self._sio.on('messages:new', self._on_messages_new_handler)
+        if self._sio is not None:
+            self._sio.on('messages:new', self._on_messages_new_handler)
         return True
 
     @property
     def server(self):
+        if self._sio is None:
+            return None
         return self._sio.get_namespace()
 
+    @property
+    def connected(self):
+        return self.server is not None and self.server.connected
+
 class LetschatPerson(Person):
     """
     This class describes a person on lets-chat's network.
@@ -328,6 +744,8 @@ class LetschatBackend(ErrBot):
         protocol = config.LCB_PROTOCOL
         hostname = config.LCB_HOSTNAME
         port = config.LCB_PORT
+        self.message_size_limit = int(getattr(config, 'MESSAGE_SIZE_LIMIT', MESSAGE_SIZE_LIMIT))
+        self.message_interval = float(getattr(config, 'LCB_MESSAGE_INTERVAL', MESSAGE_INTERVAL))
         self.token = identity.get('token', None)
         if not self.token:
             log.fatal(
@@ -336,12 +754,24 @@ class LetschatBackend(ErrBot):
             )
             sys.exit(1)
 
+        self.journal = None
+        if getattr(config, 'LCB_OUTBOUND_JOURNAL', False):
+            path = os.path.join(config.BOT_DATA_DIR, 'letschat-outbound.journal')
+            self.journal = OutboundJournal(path)
+
         callbacks = {
             'on_users_join': self._on_users_join_message,
             'on_users_leave': self._on_users_leave_message,
             'on_messages_new': self._on_messages_new_message,
         }
-        self.client = LetschatClient(hostname, port, self.token, protocol, callbacks=callbacks)
+        self.client = LetschatClient(hostname, port, self.token, protocol,
+                                     callbacks=callbacks, journal=self.journal)
+
+        # Outgoing messages are paced by a thread of their own so that a
+        # reply sent from the socket receive callback never sleeps there.
+        self._outbox = queue.Queue()
+        self._sender = threading.Thread(target=self._send_loop, name='letschat-sender', daemon=True)
+        self._sender.start()
 
     def _on_users_join_message(self, *args):
         for event in args:
@@ -424,8 +854,6 @@ class LetschatBackend(ErrBot):
         """
         Create a reply prefix for group chat
         """
-        super().prefix_groupchat_reply(message, identifier)
-
         message.body = '@{} {}'.format(identifier.username, message.text)
 
     def build_message(self, text):
@@ -455,13 +883,15 @@ class LetschatBackend(ErrBot):
         raise RuntimeError('Unrecognized identifier: {}'.format(text))
 
     def serve_forever(self):
-        while not self.client.server.connected:
-            try:
-                self.client.wait(seconds=1)
-            except:
-                self.disconnect_callback()
-                self.shutdown()
-                raise Exception('Connection failed, invalid token?')
+        try:
+            self.client.connect()
+        except Exception as e:
+            self.disconnect_callback()
+            self.shutdown()
+            if isinstance(e, ImportError):
+                log.fatal('Could not start the lets-chat back-end: {}'.format(e))
+                raise
+            raise Exception('Connection failed, invalid token?') from e
 
         username = self.client.server.username
         self.bot_identifier = LetschatPerson(self.client, username)
@@ -520,28 +950,159 @@ class LetschatBackend(ErrBot):
         return rooms_
 
     def send_message(self, mess):
-        super().send_message(mess)
-        try:
-            if isinstance(mess.to, RoomOccupant):
-                log.debug('This is a divert to private ...')
-            to_roomid = mess.to.roomid
+        self._queue_messages([mess])
 
-            message = {
-                'room': to_roomid,
-                'text': mess.body,
-            }
+    def split_and_send_message(self, mess):
+        """
+        Split a long message with :func:`split_message` and send the parts
 
-            self.client.emit_messages_create(message)
-        except Exception:
-            log.exception(
-                    'An exception occurred while trying to send the following message '
-                    'to {}: {}'.format(mess.to, mess.body)
-            )
+        Replaces errbot's own splitter so that code fences survive the cut.
+        Each part is at most MESSAGE_SIZE_LIMIT characters and the parts go
+        out LCB_MESSAGE_INTERVAL seconds apart.
+        """
+        parts = []
+        for body in split_message(mess.body, self.message_size_limit):
+            part = mess.clone()
+            part.body = body
+            parts.append(part)
+        self._queue_messages(parts)
+
+    def _queue_messages(self, messages):
+        """
+        Hand messages to the sender thread, to be sent in order and paced
+        """
+        items = []
+        for mess in messages:
+            super().send_message(mess)
+            try:
+                if isinstance(mess.to, RoomOccupant):
+                    log.debug('This is a divert to private ...')
+                items.append((mess, mess.to.roomid))
+            except Exception:
+                log.exception(
+                        'An exception occurred while trying to send the following message '
+                        'to {}: {}'.format(mess.to, mess.body)
+                )
+        if items:
+            self._outbox.put(items)
+
+    def _send_loop(self):
+        """
+        Emit queued messages in order, pacing the parts of long ones
+        """
+        while True:
+            items = self._outbox.get()
+            if items is None:
+                return
+
+            for index, (mess, to_roomid) in enumerate(items):
+                if index:
+                    time.sleep(self.message_interval)
+
+                message = {
+                    'room': to_roomid,
+                    'text': mess.body,
+                }
+
+                try:
+                    self.client.emit_messages_create(message)
+                except Exception:
+                    log.exception(
+                            'An exception occurred while trying to send the following message '
+                            'to {}: {}'.format(mess.to, mess.body)
+                    )
+
+    def send_lines(self, identifier, lines):
+        """
+        Send the text produced by an iterable to identifier as it arrives.
+
+        The iterable is consumed on a thread of its own. A line is sent
+        at once when nothing was sent during the last message interval,
+        otherwise it waits at most until the interval ends and goes out
+        together with the lines received in the meantime, so a plugin can
+        yield output from a generator and have the first lines delivered
+        before the rest is computed. Messages are also sent whenever the
+        buffer reaches the message size limit. A code fence open at that
+        point is closed and reopened in the next message.
+
+        :param identifier:
+            The person or room to send to.
+        :param lines:
+            An iterable (typically a generator) of strings.
+        """
+        produced = queue.Queue()
+        done = object()
+        errors = []
+
+        def produce():
+            try:
+                for line in lines:
+                    produced.put(line)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                produced.put(done)
+
+        threading.Thread(target=produce, name='letschat-lines', daemon=True).start()
+
+        buffer = []
+        size = 0
+        fence = None
+        last = None
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0, deadline - time.monotonic())
+            try:
+                line = produced.get(timeout=timeout)
+            except queue.Empty:
+                line = None
+
+            if line is done:
+                break
+
+            if line is not None and fence is not None and buffer == [fence] \
+                    and line.strip().startswith(CODE_FENCE):
+                # the reopened block got nothing more before closing.
+                buffer = []
+                size = 0
+                fence = None
+            elif line is not None:
+                buffer.append(line)
+                size += len(line) + 1
+                if line.strip().startswith(CODE_FENCE):
+                    fence = None if fence else line
+
+            now = time.monotonic()
+            due = last is None or now - last >= self.message_interval
+            if len(buffer) > (1 if fence else 0) and (due or size >= self.message_size_limit):
+                if fence is not None:
+                    buffer.append(CODE_FENCE)
+                self.send(identifier, '\n'.join(buffer))
+                buffer = [fence] if fence is not None else []
+                size = sum(len(line_) + 1 for line_ in buffer)
+                last = now
+                deadline = None
+            elif len(buffer) > (1 if fence else 0):
+                deadline = last + self.message_interval
+
+        if len(buffer) > (1 if fence else 0):
+            self.send(identifier, '\n'.join(buffer))
+
+        if errors:
+            raise errors[0]
 
     def shutdown(self):
         super().shutdown()
+        if self._sender is not None:
+            self._outbox.put(None)
+            self._sender.join()
+            self._sender = None
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
 
     def connect(self):
+        self.client.connect()
         return self.client
 
     def query_room(self, room):
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Outbound throughput benchmark: journaled vs. direct sending.
+
+LetschatClient is wired to a loopback socket that acknowledges every
+messages:create immediately, so the numbers isolate the cost of the
+journal (and its fsyncs) from the network.
+
+Usage:
+    python bench/bench_journal.py [--messages N] [--threads 1,4,16] [--dir PATH]
+"""
+
+import argparse
+import importlib.util
+import os
+import tempfile
+import threading
+import time
+
+ROOTDIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKEND = os.path.join(ROOTDIR, 'backends', 'letschat.py')
+
+
+def load_backend():
+    spec = importlib.util.spec_from_file_location('letschat', BACKEND)
+    letschat = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(letschat)
+    return letschat
+
+
+class LoopbackNamespace():
+    connected = True
+
+
+class LoopbackSocketIO():
+    """
+    Stands in for socketIO_client.SocketIO and acks every emit at once
+    """
+
+    def __init__(self):
+        self._namespace = LoopbackNamespace()
+
+    def get_namespace(self):
+        return self._namespace
+
+    def emit(self, event, *args):
+        if args and callable(args[-1]):
+            args[-1]({'text': args[0].get('text')})
+
+    def on(self, event, handler):
+        pass
+
+
+def run(client, messages, threads):
+    per_thread = messages // threads
+
+    def worker(index):
+        for i in range(per_thread):
+            client.emit_messages_create({'room': 'bench', 'text': 'message {}-{}'.format(index, i)})
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    start = time.perf_counter()
+    for worker_ in workers:
+        worker_.start()
+    for worker_ in workers:
+        worker_.join()
+    return per_thread * threads / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--messages', type=int, default=2000)
+    parser.add_argument('--threads', default='1,4,16')
+    parser.add_argument('--dir', default=None, help='directory for the journal file')
+    args = parser.parse_args()
+
+    letschat = load_backend()
+    threads = [int(count) for count in args.threads.split(',')]
+
+    print('{:<10} {:>8} {:>14}'.format('mode', 'threads', 'msg/s'))
+    for count in threads:
+        client = letschat.LetschatClient('localhost', 5000, 'token')
+        client._sio = LoopbackSocketIO()
+        print('{:<10} {:>8} {:>14.0f}'.format('direct', count, run(client, args.messages, count)))
+
+    for count in threads:
+        with tempfile.TemporaryDirectory(dir=args.dir) as tmpdir:
+            journal = letschat.OutboundJournal(os.path.join(tmpdir, 'bench.journal'))
+            client = letschat.LetschatClient('localhost', 5000, 'token', journal=journal)
+            client._sio = LoopbackSocketIO()
+            client._drain_journal()
+            rate = run(client, args.messages, count)
+            journal.close()
+        print('{:<10} {:>8} {:>14.0f}'.format('journaled', count, rate))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""
+Startup-time benchmark for the lets-chat back-end.
+
+Measures, separately:
+
+* importing backends/letschat.py in a fresh interpreter (as Yapsy does),
+* constructing a LetschatClient,
+* constructing a LetschatBackend from config.py, without and with the
+  outbound journal,
+* connecting it to a lets-chat server (only when ERRBOT_LCB_TOKEN is set).
+
+Usage:
+    python bench/bench_startup.py [--repeat N]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOTDIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKEND = os.path.join(ROOTDIR, 'backends', 'letschat.py')
+
+# Executed in a child interpreter so every sample pays a cold import.
+CHILD = r'''
+import importlib.util
+import json
+import sys
+import tempfile
+import time
+
+spec = importlib.util.spec_from_file_location('config', {config!r})
+config = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(config)
+try:
+    from errbot.bootstrap import bot_config_defaults
+    bot_config_defaults(config)
+except ImportError:
+    pass
+config.BOT_DATA_DIR = tempfile.mkdtemp()
+
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location('letschat', {backend!r})
+letschat = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(letschat)
+imported = time.perf_counter()
+letschat.LetschatClient('localhost', 5000, 'token')
+client = time.perf_counter()
+
+config.LCB_OUTBOUND_JOURNAL = False
+letschat.LetschatBackend(config)
+backend = time.perf_counter()
+
+config.LCB_OUTBOUND_JOURNAL = True
+journaled = letschat.LetschatBackend(config)
+backend_journal = time.perf_counter()
+journaled.journal.close()
+
+print(json.dumps({{
+    'import': imported - start,
+    'client': client - imported,
+    'backend': backend - client,
+    'backend+journal': backend_journal - backend,
+    'transport_loaded': 'socketIO_client' in sys.modules,
+}}))
+'''
+
+
+def sample(repeat):
+    results = []
+    child = CHILD.format(backend=BACKEND, config=os.path.join(ROOTDIR, 'config.py'))
+    env = dict(os.environ)
+    env.setdefault('ERRBOT_LCB_TOKEN', 'bench-token')
+    for _ in range(repeat):
+        out = subprocess.check_output([sys.executable, '-c', child], cwd=ROOTDIR, env=env)
+        results.append(json.loads(out.decode().strip().splitlines()[-1]))
+    return results
+
+
+def connect_time():
+    token = os.environ.get('ERRBOT_LCB_TOKEN')
+    if not token:
+        return None
+
+    sys.path.insert(0, os.path.join(ROOTDIR, 'backends'))
+    import letschat
+
+    client = letschat.LetschatClient(
+            os.environ.get('ERRBOT_LCB_HOSTNAME', 'localhost'),
+            int(os.environ.get('ERRBOT_LCB_PORT', 5000)),
+            token,
+            os.environ.get('ERRBOT_LCB_PROTOCOL', 'http'),
+    )
+    start = time.perf_counter()
+    client.connect()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    results = sample(args.repeat)
+    for key in ('import', 'client', 'backend', 'backend+journal'):
+        values = [result[key] * 1000 for result in results]
+        print('{:<16} median {:8.2f} ms  min {:8.2f} ms  max {:8.2f} ms'.format(
+                key, statistics.median(values), min(values), max(values)))
+    print('{:<16} {}'.format('transport', 'loaded' if any(r['transport_loaded'] for r in results)
+                             else 'not loaded'))
+
+    elapsed = connect_time()
+    if elapsed is None:
+        print('{:<16} skipped (set ERRBOT_LCB_TOKEN to measure)'.format('connect'))
+    else:
+        print('{:<16} {:8.2f} ms'.format('connect', elapsed * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -13,6 +13,8 @@ LCB_TOKEN = os.environ.get('ERRBOT_LCB_TOKEN', '')
 LCB_ROOMS = os.environ.get('ERRBOT_LCB_ROOMS','').split(',')
 LCB_ADMINS = os.environ.get('ERRBOT_LCB_ADMINS', '').split(',')
 LCB_NAME = os.environ.get('ERRBOT_LCB_NAME', '')
+LCB_MESSAGE_INTERVAL = float(os.environ.get('ERRBOT_LCB_MESSAGE_INTERVAL', 0.5))
+LCB_OUTBOUND_JOURNAL = os.environ.get('ERRBOT_LCB_OUTBOUND_JOURNAL', '') in ('1', 'true', 'yes')
 
 BOT_DATA_DIR = r'{}/data'.format(ROOTDIR)
 BOT_EXTRA_PLUGIN_DIR = '{}/plugins'.format(ROOTDIR)
@@ -22,6 +24,7 @@ BOT_LOG_FILE = r'{}/errbot.log'.format(ROOTDIR)
 BOT_LOG_LEVEL = logging.DEBUG
 
 BOT_ADMINS = tuple(LCB_ADMINS)
+MESSAGE_SIZE_LIMIT = int(os.environ.get('ERRBOT_MESSAGE_SIZE_LIMIT', 4096))
 BOT_IDENTITY = {
     'token': LCB_TOKEN,
 }
@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+
+import importlib.util
+import os
+import random
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+ROOTDIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _stub_errbot():
+    """
+    Register a minimal errbot so the back-end can be imported without it
+    """
+    class Person():
+        pass
+
+    class RoomOccupant(Person):
+        pass
+
+    class RoomError(Exception):
+        pass
+
+    class ErrBot():
+        def __init__(self, config):
+            self.bot_config = config
+
+    base = types.ModuleType('errbot.backends.base')
+    base.Message = type('Message', (), {})
+    base.Presence = type('Presence', (), {})
+    base.Room = type('Room', (), {})
+    base.Person = Person
+    base.RoomOccupant = RoomOccupant
+    base.ONLINE = 'online'
+    base.AWAY = 'away'
+    base.RoomError = RoomError
+    base.RoomDoesNotExistError = RoomError
+    base.UserDoesNotExistError = RoomError
+    core = types.ModuleType('errbot.core')
+    core.ErrBot = ErrBot
+
+    sys.modules['errbot'] = types.ModuleType('errbot')
+    sys.modules['errbot.backends'] = types.ModuleType('errbot.backends')
+    sys.modules['errbot.backends.base'] = base
+    sys.modules['errbot.core'] = core
+
+
+try:
+    import errbot  # noqa: F401
+except ImportError:
+    _stub_errbot()
+
+_spec = importlib.util.spec_from_file_location('letschat', os.path.join(ROOTDIR, 'backends', 'letschat.py'))
+letschat = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(letschat)
+
+
+def unsplit(chunks):
+    """
+    Undo split_message for chunks cut on line boundaries
+
+    Drops the fences it inserted and rejoins the chunks with newlines.
+    """
+    parts = []
+    reopened = None
+    for index, chunk in enumerate(chunks):
+        lines = chunk.split('\n')
+        if reopened is not None:
+            assert lines[0] == reopened
+            lines = lines[1:]
+
+        fence = reopened
+        for line in lines[:-1]:
+            if line.strip().startswith(letschat.CODE_FENCE):
+                fence = None if fence else line
+        following = chunks[index + 1].split('\n')[0] if index + 1 < len(chunks) else None
+        if fence is not None and lines[-1] == letschat.CODE_FENCE and following == fence:
+            lines = lines[:-1]
+            reopened = fence
+        else:
+            reopened = None
+        parts.append('\n'.join(lines))
+    return '\n'.join(parts)
+
+
+def test_split_message_short_text_is_untouched():
+    assert list(letschat.split_message('hello\nworld', 100)) == ['hello\nworld']
+
+
+@pytest.mark.parametrize('limit', [20, 37, 64, 4096])
+def test_split_message_cuts_on_lines(limit):
+    text = '\n'.join('line number {}'.format(i) for i in range(500))
+
+    chunks = list(letschat.split_message(text, limit))
+
+    assert all(len(chunk) <= limit for chunk in chunks)
+    assert unsplit(chunks) == text
+    assert '\n'.join(chunks) == text
+
+
+def test_split_message_cuts_long_lines_between_chunks_only():
+    text = 'short line\n' + 'y' * 5000
+
+    chunks = list(letschat.split_message(text, 4096))
+
+    assert all(len(chunk) <= 4096 for chunk in chunks)
+    assert len(chunks) == 2
+    assert chunks[0].startswith('short line\nyyyy')
+    assert ''.join(chunks) == text
+
+
+def test_split_message_keeps_fence_opener_whole():
+    text = '```python\n' + '\n'.join('l{}'.format(i) for i in range(8)) + '\n```'
+
+    chunks = list(letschat.split_message(text, 20))
+
+    assert all(len(chunk) <= 20 for chunk in chunks)
+    assert all(chunk.startswith('```python\n') and chunk.endswith('\n```') for chunk in chunks)
+
+
+def test_split_message_reopens_fence_across_chunks():
+    code = '\n'.join('    print({})'.format(i) for i in range(50))
+    text = 'before\n```py\n' + code + '\n```\nafter'
+
+    chunks = list(letschat.split_message(text, 120))
+
+    assert len(chunks) > 2
+    assert all(len(chunk) <= 120 for chunk in chunks)
+    assert all(chunk.count('```') % 2 == 0 for chunk in chunks)
+    assert unsplit(chunks) == text
+
+
+def test_split_message_cuts_long_line_inside_fence():
+    text = '```py\n' + 'z' * 50 + '\n```'
+
+    chunks = list(letschat.split_message(text, 20))
+
+    assert all(len(chunk) <= 20 for chunk in chunks)
+    assert all(chunk.startswith('```py\n') and chunk.endswith('\n```') for chunk in chunks)
+    assert ''.join(chunk[len('```py\n'):-len('\n```')] for chunk in chunks) == 'z' * 50
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_split_message_respects_limit_on_mixed_input(seed):
+    rand = random.Random(seed)
+    lines = [rand.choice(['```py', '```', 'x' * rand.randint(0, 300)]) for _ in range(80)]
+    limit = rand.randint(20, 400)
+
+    chunks = list(letschat.split_message('\n'.join(lines), limit))
+
+    assert all(len(chunk) <= limit for chunk in chunks)
+
+
+@pytest.fixture
+def backend():
+    backend = letschat.LetschatBackend.__new__(letschat.LetschatBackend)
+    backend.message_interval = 0.2
+    backend.message_size_limit = 4096
+    backend.sent = []
+    start = time.monotonic()
+    backend.send = lambda identifier, text: backend.sent.append((time.monotonic() - start, text))
+    return backend
+
+
+def test_send_lines_flushes_on_deadline(backend):
+    def lines():
+        yield 'header'
+        time.sleep(0.05)
+        yield 'step 1 done'
+        time.sleep(1)
+        yield 'step 2 done'
+
+    backend.send_lines(None, lines())
+
+    assert [text for _, text in backend.sent] == ['header', 'step 1 done', 'step 2 done']
+    assert backend.sent[1][0] < 0.5
+
+
+def test_send_lines_closes_and_reopens_fence(backend):
+    def lines():
+        yield '```'
+        yield 'code'
+        time.sleep(0.5)
+        yield 'more'
+        yield '```'
+
+    backend.send_lines(None, lines())
+
+    assert [text for _, text in backend.sent] == ['```\ncode\n```', '```\nmore\n```']
+
+
+def test_send_lines_reraises_generator_error(backend):
+    def lines():
+        yield 'partial'
+        raise ValueError('boom')
+
+    with pytest.raises(ValueError):
+        backend.send_lines(None, lines())
+    assert [text for _, text in backend.sent] == ['partial']
+
+
+def test_connect_without_transport_raises_import_error(monkeypatch):
+    monkeypatch.setattr(letschat, '_socketio', None)
+    monkeypatch.setitem(sys.modules, 'socketIO_client', None)
+    client = letschat.LetschatClient('localhost', 5000, 'token')
+
+    with pytest.raises(ImportError, match='pip install'):
+        client.connect()
+
+
+def test_failed_connect_can_be_retried(monkeypatch):
+    class Namespace():
+        connected = False
+
+    class SocketIO():
+        def __init__(self, *args, **kw):
+            self._namespace = Namespace()
+
+        def on(self, event, handler):
+            pass
+
+        def get_namespace(self):
+            return self._namespace
+
+        def wait(self, seconds=None):
+            raise ConnectionError('invalid token')
+
+    monkeypatch.setattr(letschat, '_socketio', types.SimpleNamespace(SocketIO=SocketIO, BaseNamespace=object))
+    client = letschat.LetschatClient('localhost', 5000, 'token')
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            client.connect()
+        assert client.server is None
+
+
+def test_journal_skips_malformed_records(tmp_path):
+    path = tmp_path / 'outbound.journal'
+    path.write_text(
+            '{"op": "put", "id": "a", "message": {"text": "kept"}}\n'
+            '["not", "a", "record"]\n'
+            '{"op": "put", "id": "b", "message": {"text": "dropped"}}\n'
+    )
+
+    journal = letschat.OutboundJournal(str(path))
+    try:
+        assert journal.pending() == [('a', {'text': 'kept'})]
+    finally:
+        journal.close()
+
+
+def test_journal_duplicate_append_waits_for_commit(tmp_path, monkeypatch):
+    journal = letschat.OutboundJournal(str(tmp_path / 'outbound.journal'))
+    release = threading.Event()
+    fsync = os.fsync
+
+    def slow_fsync(fd):
+        release.wait()
+        fsync(fd)
+
+    monkeypatch.setattr(letschat.os, 'fsync', slow_fsync)
+    first = threading.Thread(target=journal.append, args=({'text': 'x'}, 'id'))
+    first.start()
+    returned = threading.Event()
+    second = threading.Thread(target=lambda: (journal.append({'text': 'x'}, 'id'), returned.set()))
+    second.start()
+
+    assert not returned.wait(0.2)
+    release.set()
+    assert returned.wait(5)
+    first.join()
+    second.join()
+    journal.close()
+
+
+def test_journal_write_error_is_raised(tmp_path, monkeypatch):
+    journal = letschat.OutboundJournal(str(tmp_path / 'outbound.journal'))
+
+    def failing_fsync(fd):
+        raise OSError(28, 'No space left on device')
+
+    monkeypatch.setattr(letschat.os, 'fsync', failing_fsync)
+    for _ in range(2):
+        with pytest.raises(OSError):
+            journal.append({'text': 'x'})
+    assert journal.pending() == []
+    journal.close()